@@ -1,6 +1,12 @@
+import concurrent.futures
 import datetime
+import functools
+import itertools
 import json
+import logging
 import os
+import re
+import threading
 import traceback
 
 from dateutil.parser import ParserError, parse
@@ -20,9 +26,88 @@ from great_expectations.data_context.types.resource_identifiers import (
     ValidationResultIdentifier,
 )
 
+logger = logging.getLogger(__name__)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_UTC = datetime.timezone.utc
+
+_ISO_RE = re.compile(r"^\d{4}-\d{2}-\d{2}[T ]\d{2}:\d{2}:\d{2}")
+# The format of run names generated by DataContext.run_validation_operator
+_BASIC_ISO_RE = re.compile(r"^\d{8}T\d{6}\.\d{1,6}Z$")
+
+_RUN_ID_KEY_RE = re.compile(r'"run_id"\s*:\s*')
+_META_OBJECT_RE = re.compile(r'"meta"\s*:\s*\{')
+_JSON_STRING_RE = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+_JSON_BRACKET_RE = re.compile(r"[{}\[\]]")
+
+_UPGRADE_PROMPT_TEMPLATE = """\
+**WARNING!**: This automated upgrade helper is currently experimental. Before proceeding, please make sure you have
+appropriate backups of your project.
+
+The following Stores and/or Data Docs sites will be upgraded:
+    - Validation Stores: {validations_stores}
+    - Data Docs Sites: {docs_sites}
+
+The following Stores and/or Data Docs sites must be upgraded manually, due to having a database backend, or backend
+type that is unsupported or unrecognized. Please consult the 0.11.x migration guide for more information:
+https://docs.greatexpectations.io/how_to_guides/migrating_versions.html
+    - Stores with database backends: {database_stores}
+    - Stores with unsupported/unrecognized backends: {unsupported_stores}
+    - Data Docs sites with unsupported/unrecognized backends: {unsupported_docs_sites}
+
+Would you like to proceed?
+"""
+
+
+def _fast_parse_run_name(run_name):
+    """Return run_name as an ISO-8601 string, raising ParserError if it is not a datetime.
+
+    Run names generated by Great Expectations are ISO-8601 strings, which are handled without
+    going through the much slower dateutil parser.
+    """
+    run_time = _parse_run_name(run_name)
+    if run_time is None:
+        raise ParserError("Unknown string format: %s", run_name)
+    return run_time
+
+
+# lru_cache does not cache exceptions, so run names that are not datetimes are cached as None
+@functools.lru_cache(maxsize=4096)
+def _parse_run_name(run_name):
+    if _BASIC_ISO_RE.match(run_name):
+        try:
+            return (
+                datetime.datetime.strptime(run_name, "%Y%m%dT%H%M%S.%fZ")
+                .replace(tzinfo=_UTC)
+                .isoformat()
+            )
+        except ValueError:
+            # Out of range fields, e.g. a 13th month, are left to dateutil to report
+            pass
+    if _ISO_RE.match(run_name):
+        try:
+            return datetime.datetime.fromisoformat(run_name).isoformat()
+        except (AttributeError, ValueError):
+            # datetime.fromisoformat is not available before python 3.7, and is stricter than dateutil
+            pass
+    try:
+        return parse(run_name).isoformat()
+    except ParserError:
+        return None
+
 
 class UpgradeHelperV11:
-    def __init__(self, data_context=None, context_root_dir=None):
+    def __init__(
+        self,
+        data_context=None,
+        context_root_dir=None,
+        max_workers=None,
+        patch_run_id_in_place=False,
+    ):
         assert (
             data_context or context_root_dir
         ), "Please provide a data_context object or a context_root_dir."
@@ -62,6 +147,13 @@ class UpgradeHelperV11:
             },
         }
 
+        # Names of skipped stores and sites, maintained alongside "skipped_*" entries in upgrade_log
+        self._skipped_db_validations_store_names = []
+        self._skipped_db_metrics_store_names = []
+        self._skipped_unsupported_validations_store_names = []
+        self._skipped_unsupported_metrics_store_names = []
+        self._skipped_unsupported_site_names = []
+
         self.upgrade_checklist = {
             "validations_store_backends": {},
             "docs_validations_store_backends": {},
@@ -69,11 +161,37 @@ class UpgradeHelperV11:
 
         self.validation_run_times = {}
 
+        # Upgrading a key is dominated by store backend IO, so keys are upgraded concurrently
+        self.max_workers = max_workers or min(32, (os.cpu_count() or 1) * 4)
+        self.key_chunk_size = 1000
+        self._lock = threading.Lock()
+        self._exception_messages = {}
+        # Formatted exceptions of run names whose run time could not be looked up
+        self._run_time_errors = {}
+
+        # Opt in to rewriting meta.run_id without parsing the whole validation result
+        self.patch_run_id_in_place = patch_run_id_in_place
+
+        self._gcs_client_cache = {}
+
         self.run_time_setters_by_backend_type = {
             TupleFilesystemStoreBackend: self._get_tuple_filesystem_store_backend_run_time,
             TupleS3StoreBackend: self._get_tuple_s3_store_backend_run_time,
             TupleGCSStoreBackend: self._get_tuple_gcs_store_backend_run_time,
         }
+        self._supported_backend_types = tuple(self.run_time_setters_by_backend_type)
+
+        self._validations_dispatch = {DatabaseStoreBackend: "database"}
+        self._validations_dispatch.update(
+            {
+                backend_type: "supported"
+                for backend_type in self._supported_backend_types
+            }
+        )
+        self._metrics_dispatch = {
+            DatabaseStoreBackend: "database",
+            InMemoryStoreBackend: "in_memory",
+        }
 
         self._generate_upgrade_checklist()
 
@@ -94,6 +212,23 @@ class UpgradeHelperV11:
             for site_name, site_config in sites.items():
                 self._process_docs_site_for_checklist(site_name, site_config)
 
+    @staticmethod
+    def _get_store_backend_category(store_backend, dispatch):
+        backend_type = type(store_backend)
+        category = dispatch.get(backend_type)
+        if category is None:
+            # Fall back to isinstance so that subclasses of known backends are categorized as before
+            category = next(
+                (
+                    backend_category
+                    for (backend_class, backend_category) in dispatch.items()
+                    if isinstance(store_backend, backend_class)
+                ),
+                "unsupported",
+            )
+            dispatch[backend_type] = category
+        return category
+
     def _process_docs_site_for_checklist(self, site_name, site_config):
         site_html_store = HtmlSiteStore(
             store_backend=site_config.get("store_backend"),
@@ -107,10 +242,11 @@ class UpgradeHelperV11:
             ValidationResultIdentifier
         ]
 
-        if isinstance(
-            site_validations_store_backend,
-            tuple(list(self.run_time_setters_by_backend_type.keys())),
-        ):
+        backend_cls_name = type(site_validations_store_backend).__name__
+        category = self._get_store_backend_category(
+            site_validations_store_backend, self._validations_dispatch
+        )
+        if category == "supported":
             self.upgrade_checklist["docs_validations_store_backends"][
                 site_name
             ] = site_validations_store_backend
@@ -118,57 +254,54 @@ class UpgradeHelperV11:
             self.upgrade_log["skipped_docs_validations_stores"]["unsupported"].append(
                 {
                     "site_name": site_name,
-                    "validations_store_backend_class": type(
-                        site_validations_store_backend
-                    ).__name__,
+                    "validations_store_backend_class": backend_cls_name,
                 }
             )
+            self._skipped_unsupported_site_names.append(site_name)
 
     def _process_validations_store_for_checklist(self, store_name, store):
         store_backend = store.store_backend
-        if isinstance(store_backend, DatabaseStoreBackend):
+        backend_cls_name = type(store_backend).__name__
+        category = self._get_store_backend_category(
+            store_backend, self._validations_dispatch
+        )
+        if category == "database":
             self.upgrade_log["skipped_validations_stores"][
                 "database_store_backends"
             ].append(
-                {
-                    "store_name": store_name,
-                    "store_backend_class": type(store_backend).__name__,
-                }
+                {"store_name": store_name, "store_backend_class": backend_cls_name,}
             )
-        elif isinstance(
-            store_backend, tuple(list(self.run_time_setters_by_backend_type.keys()))
-        ):
+            self._skipped_db_validations_store_names.append(store_name)
+        elif category == "supported":
             self.upgrade_checklist["validations_store_backends"][
                 store_name
             ] = store_backend
         else:
             self.upgrade_log["skipped_validations_stores"]["unsupported"].append(
-                {
-                    "store_name": store_name,
-                    "store_backend_class": type(store_backend).__name__,
-                }
+                {"store_name": store_name, "store_backend_class": backend_cls_name,}
             )
+            self._skipped_unsupported_validations_store_names.append(store_name)
 
     def _process_metrics_store_for_checklist(self, store_name, store):
         store_backend = store.store_backend
-        if isinstance(store_backend, DatabaseStoreBackend):
+        backend_cls_name = type(store_backend).__name__
+        category = self._get_store_backend_category(
+            store_backend, self._metrics_dispatch
+        )
+        if category == "database":
             self.upgrade_log["skipped_metrics_stores"][
                 "database_store_backends"
             ].append(
-                {
-                    "store_name": store_name,
-                    "store_backend_class": type(store_backend).__name__,
-                }
+                {"store_name": store_name, "store_backend_class": backend_cls_name,}
             )
-        elif isinstance(store_backend, InMemoryStoreBackend):
+            self._skipped_db_metrics_store_names.append(store_name)
+        elif category == "in_memory":
             pass
         else:
             self.upgrade_log["skipped_metrics_stores"]["unsupported"].append(
-                {
-                    "store_name": store_name,
-                    "store_backend_class": type(store_backend).__name__,
-                }
+                {"store_name": store_name, "store_backend_class": backend_cls_name,}
             )
+            self._skipped_unsupported_metrics_store_names.append(store_name)
 
     def upgrade_store_backend(self, store_backend, store_name=None, site_name=None):
         assert store_name or site_name, "Must pass either store_name or site_name."
@@ -176,14 +309,40 @@ class UpgradeHelperV11:
             store_name and site_name
         ), "Must pass either store_name or site_name, not both."
 
+        # Keys are listed lazily, so keys written by this upgrade may be listed again
+        listed_keys = self._iter_keys_with_last_modified(store_backend)
+
         try:
-            validation_source_keys = store_backend.list_keys()
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=self.max_workers
+            ) as executor:
+                # Submit keys in bounded chunks so the listing is not consumed all at once
+                while True:
+                    listed_keys_chunk = list(
+                        itertools.islice(listed_keys, self.key_chunk_size)
+                    )
+                    if not listed_keys_chunk:
+                        break
+                    source_keys_chunk = []
+                    for key, last_modified in listed_keys_chunk:
+                        if len(key) < 2 or self._is_upgraded_key(key):
+                            continue
+                        self._resolve_run_time(key, last_modified, store_backend)
+                        source_keys_chunk.append(key)
+                    list(
+                        executor.map(
+                            lambda source_key: self._upgrade_one_key(
+                                source_key=source_key,
+                                store_backend=store_backend,
+                                store_name=store_name,
+                                site_name=site_name,
+                            ),
+                            source_keys_chunk,
+                        )
+                    )
         except Exception as e:
-            exception_traceback = traceback.format_exc()
-            exception_message = (
-                f'{type(e).__name__}: "{str(e)}".  '
-                f'Traceback: "{exception_traceback}".'
-            )
+            # Failures of individual keys are logged by _upgrade_one_key, so this was raised while listing keys
+            exception_message = self._format_exception(e)
             self._update_upgrade_log(
                 store_backend=store_backend,
                 store_name=store_name,
@@ -191,63 +350,111 @@ class UpgradeHelperV11:
                 exception_message=exception_message,
             )
 
-        for source_key in validation_source_keys:
-            try:
-                run_name = source_key[-2]
-                dest_key = None
-                if run_name not in self.validation_run_times:
-                    self.run_time_setters_by_backend_type.get(type(store_backend))(
-                        source_key, store_backend
-                    )
-                dest_key_list = list(source_key)
-                dest_key_list.insert(-1, self.validation_run_times[run_name])
-                dest_key = tuple(dest_key_list)
-            except Exception as e:
-                exception_traceback = traceback.format_exc()
-                exception_message = (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                self._update_upgrade_log(
-                    store_backend=store_backend,
-                    source_key=source_key,
-                    dest_key=dest_key,
-                    store_name=store_name,
-                    site_name=site_name,
-                    exception_message=exception_message,
-                )
+    @staticmethod
+    def _iter_keys_with_last_modified(store_backend):
+        """Yield (key, last_modified) pairs, where last_modified is None if the listing does not provide it."""
+        if isinstance(
+            store_backend,
+            (TupleFilesystemStoreBackend, TupleS3StoreBackend, TupleGCSStoreBackend),
+        ):
+            yield from store_backend._iter_keys_with_last_modified()
+        else:
+            for key in store_backend.list_keys():
+                yield key, None
+
+    def _is_upgraded_key(self, key):
+        # An upgraded key has the run time of the run name before it where the old key had its batch
+        return len(key) >= 3 and self.validation_run_times.get(key[-3]) == key[-2]
+
+    def _resolve_run_time(self, key, last_modified, store_backend):
+        """Look up the run time of the run of key once, before any of its keys are upgraded."""
+        run_name = key[-2]
+        if run_name in self.validation_run_times or run_name in self._run_time_errors:
+            return
+        try:
+            if last_modified is None:
+                run_time = self.run_time_setters_by_backend_type.get(
+                    type(store_backend)
+                )(key, store_backend)
+            else:
+                try:
+                    run_time = _fast_parse_run_name(run_name)
+                except ParserError:
+                    run_time = last_modified.isoformat()
+        except Exception as e:
+            # dateutil may raise e.g. OverflowError as well as ParserError. The failure is logged for each
+            # key of the run, rather than ending the upgrade of the whole store.
+            self._run_time_errors[run_name] = self._format_exception(e)
+            return
+        self.validation_run_times[run_name] = run_time
 
-            try:
-                if store_name:
-                    self._update_validation_result_json(
-                        source_key=source_key,
-                        dest_key=dest_key,
-                        run_name=run_name,
-                        store_backend=store_backend,
-                    )
-                else:
-                    store_backend.move(source_key, dest_key)
-                self._update_upgrade_log(
-                    store_backend=store_backend,
+    def _upgrade_one_key(self, source_key, store_backend, store_name, site_name):
+        run_name = source_key[-2]
+        run_time = self.validation_run_times.get(run_name)
+        if run_time is None:
+            # Without a run time there is no dest_key to write
+            self._update_upgrade_log(
+                store_backend=store_backend,
+                source_key=source_key,
+                store_name=store_name,
+                site_name=site_name,
+                exception_message=self._run_time_errors[run_name],
+            )
+            return
+        dest_key = source_key[:-1] + (run_time, source_key[-1])
+
+        try:
+            if store_name:
+                self._update_validation_result_json(
                     source_key=source_key,
                     dest_key=dest_key,
-                    store_name=store_name,
-                    site_name=site_name,
-                )
-            except Exception as e:
-                exception_traceback = traceback.format_exc()
-                exception_message = (
-                    f'{type(e).__name__}: "{str(e)}".  '
-                    f'Traceback: "{exception_traceback}".'
-                )
-                self._update_upgrade_log(
+                    run_name=run_name,
                     store_backend=store_backend,
-                    source_key=source_key,
-                    dest_key=dest_key,
-                    store_name=store_name,
-                    site_name=site_name,
-                    exception_message=exception_message,
                 )
+            else:
+                store_backend.move(source_key, dest_key)
+            self._update_upgrade_log(
+                store_backend=store_backend,
+                source_key=source_key,
+                dest_key=dest_key,
+                store_name=store_name,
+                site_name=site_name,
+            )
+        except Exception as e:
+            exception_message = self._format_exception(e)
+            self._update_upgrade_log(
+                store_backend=store_backend,
+                source_key=source_key,
+                dest_key=dest_key,
+                store_name=store_name,
+                site_name=site_name,
+                exception_message=exception_message,
+            )
+
+    def _format_exception(self, e):
+        """Format an exception and its traceback for the upgrade log.
+
+        A failure repeated for many keys (e.g. missing permissions) formats its traceback once. Its message
+        is shared by every log entry whose exception has the same type, message and traceback origin.
+        """
+        exception_key = (
+            type(e).__name__,
+            str(e),
+            tuple(
+                (frame.f_code.co_filename, lineno)
+                for frame, lineno in traceback.walk_tb(e.__traceback__)
+            ),
+        )
+        exception_message = self._exception_messages.get(exception_key)
+        if exception_message is None:
+            exception_traceback = "".join(
+                traceback.format_exception(type(e), e, e.__traceback__)
+            )
+            exception_message = self._exception_messages.setdefault(
+                exception_key,
+                f'{type(e).__name__}: "{str(e)}".  Traceback: "{exception_traceback}".',
+            )
+        return exception_message
 
     def _update_upgrade_log(
         self,
@@ -272,36 +479,37 @@ class UpgradeHelperV11:
         except Exception:
             dest_url = f"Unable to generate URL for key: {dest_key}"
 
-        if not exception_message:
-            log_dict = {"src": src_url, "dest": dest_url}
-        else:
-            key_name = "validation_store_name" if store_name else "site_name"
-            log_dict = {
-                key_name: store_name if store_name else site_name,
-                "src": src_url,
-                "dest": dest_url,
-                "exception_message": exception_message,
-            }
-            self.upgrade_log["exceptions"].append(log_dict)
-
-        if store_name:
-            if exception_message:
-                self.upgrade_log["upgraded_validations_stores"][store_name][
-                    "exceptions"
-                ] = True
+        with self._lock:
+            if not exception_message:
+                log_dict = {"src": src_url, "dest": dest_url}
             else:
-                self.upgrade_log["upgraded_validations_stores"][store_name][
-                    "validations_updated"
-                ].append(log_dict)
-        else:
-            if exception_message:
-                self.upgrade_log["upgraded_docs_site_validations_stores"][site_name][
-                    "exceptions"
-                ] = True
+                key_name = "validation_store_name" if store_name else "site_name"
+                log_dict = {
+                    key_name: store_name if store_name else site_name,
+                    "src": src_url,
+                    "dest": dest_url,
+                    "exception_message": exception_message,
+                }
+                self.upgrade_log["exceptions"].append(log_dict)
+
+            if store_name:
+                if exception_message:
+                    self.upgrade_log["upgraded_validations_stores"][store_name][
+                        "exceptions"
+                    ] = True
+                else:
+                    self.upgrade_log["upgraded_validations_stores"][store_name][
+                        "validations_updated"
+                    ].append(log_dict)
             else:
-                self.upgrade_log["upgraded_docs_site_validations_stores"][site_name][
-                    "validation_result_pages_updated"
-                ].append(log_dict)
+                if exception_message:
+                    self.upgrade_log["upgraded_docs_site_validations_stores"][
+                        site_name
+                    ]["exceptions"] = True
+                else:
+                    self.upgrade_log["upgraded_docs_site_validations_stores"][
+                        site_name
+                    ]["validation_result_pages_updated"].append(log_dict)
 
     def _update_validation_result_json(
         self, source_key, dest_key, run_name, store_backend
@@ -310,104 +518,143 @@ class UpgradeHelperV11:
             "run_name": run_name,
             "run_time": self.validation_run_times[run_name],
         }
-        validation_json_dict = json.loads(store_backend.get(source_key))
-        validation_json_dict["meta"]["run_id"] = new_run_id_dict
-        store_backend.set(dest_key, json.dumps(validation_json_dict))
+
+        def patch_run_id(value):
+            if self.patch_run_id_in_place:
+                patched_value = self._patch_run_id_in_place(
+                    value, run_name, new_run_id_dict
+                )
+                if patched_value is not None:
+                    return patched_value
+
+            # orjson is much faster for large validation results, but rejects NaN and Infinity,
+            # which the json module accepts. Documents orjson can parse can be re-serialized by it.
+            use_orjson = orjson is not None
+            if use_orjson:
+                try:
+                    validation_json_dict = orjson.loads(value)
+                except orjson.JSONDecodeError:
+                    use_orjson = False
+            if not use_orjson:
+                validation_json_dict = json.loads(value)
+
+            if validation_json_dict["meta"].get("run_id") == new_run_id_dict:
+                # Returning the value unchanged lets the store backend copy it server-side
+                return value
+            validation_json_dict["meta"]["run_id"] = new_run_id_dict
+
+            if use_orjson:
+                return orjson.dumps(validation_json_dict).decode("utf-8")
+            return json.dumps(validation_json_dict)
+
+        store_backend.copy(source_key, dest_key, patch_fn=patch_run_id)
         store_backend.remove_key(source_key)
 
+    @staticmethod
+    def _patch_run_id_in_place(value, run_name, new_run_id_dict):
+        """Replace a bare string meta.run_id without decoding the validation result.
+
+        Returns None, so that the caller falls back to decoding the JSON, unless value has exactly one
+        "run_id" key, its value is the string run_name, and it is a key of the top-level "meta" object.
+        """
+        run_id_key_matches = list(itertools.islice(_RUN_ID_KEY_RE.finditer(value), 2))
+        if len(run_id_key_matches) != 1:
+            return None
+        run_id_key_match = run_id_key_matches[0]
+        run_id_match = _JSON_STRING_RE.match(value, run_id_key_match.end())
+        if not run_id_match:
+            return None
+        try:
+            if json.loads(run_id_match.group()) != run_name:
+                return None
+        except ValueError:
+            return None
+
+        # The "run_id" key must be directly in the object of the nearest preceding "meta" key. Brackets
+        # are only counted outside of JSON strings, which may contain any character.
+        meta_start = value.rfind('"meta"', 0, run_id_key_match.start())
+        meta_match = (
+            _META_OBJECT_RE.match(value, meta_start) if meta_start >= 0 else None
+        )
+        if not meta_match:
+            return None
+        depth = 0
+        for bracket in _JSON_BRACKET_RE.findall(
+            _JSON_STRING_RE.sub("", value[meta_match.end() : run_id_key_match.start()])
+        ):
+            depth += 1 if bracket in "{[" else -1
+            if depth < 0:
+                return None
+        if depth:
+            return None
+
+        # That object must be the value of a top-level key, so after the run_id only it and the
+        # validation result itself are closed
+        tail = _JSON_STRING_RE.sub("", value[run_id_match.end() :])
+        if tail.count("}") + tail.count("]") - tail.count("{") - tail.count("[") != 2:
+            return None
+
+        return (
+            value[: run_id_match.start()]
+            + json.dumps(new_run_id_dict)
+            + value[run_id_match.end() :]
+        )
+
     def _get_tuple_filesystem_store_backend_run_time(self, source_key, store_backend):
         run_name = source_key[-2]
         try:
-            self.validation_run_times[run_name] = parse(run_name).isoformat()
+            return _fast_parse_run_name(run_name)
         except ParserError:
             source_path = os.path.join(
                 store_backend.full_base_directory,
                 store_backend._convert_key_to_filepath(source_key),
             )
             path_mod_timestamp = os.path.getmtime(source_path)
-            path_mod_iso_str = datetime.datetime.fromtimestamp(
-                path_mod_timestamp, tz=datetime.timezone.utc
+            return datetime.datetime.fromtimestamp(
+                path_mod_timestamp, tz=_UTC
             ).isoformat()
-            self.validation_run_times[run_name] = path_mod_iso_str
 
-    def _get_tuple_s3_store_backend_run_time(self, source_key, store_backend):
-        import boto3
+    def _get_gcs_client(self, project):
+        if project not in self._gcs_client_cache:
+            from google.cloud import storage
+
+            self._gcs_client_cache[project] = storage.Client(project=project)
+        return self._gcs_client_cache[project]
 
-        s3 = boto3.resource("s3")
+    def _get_tuple_s3_store_backend_run_time(self, source_key, store_backend):
         run_name = source_key[-2]
 
         try:
-            self.validation_run_times[run_name] = parse(run_name).isoformat()
+            return _fast_parse_run_name(run_name)
         except ParserError:
+            s3 = store_backend._get_s3_client()
             source_path = store_backend._convert_key_to_filepath(source_key)
             if not source_path.startswith(store_backend.prefix):
                 source_path = os.path.join(store_backend.prefix, source_path)
-            source_object = s3.Object(store_backend.bucket, source_path)
-            source_object_last_mod = source_object.last_modified.isoformat()
-
-            self.validation_run_times[run_name] = source_object_last_mod
+            source_object = s3.head_object(Bucket=store_backend.bucket, Key=source_path)
+            return source_object["LastModified"].isoformat()
 
     def _get_tuple_gcs_store_backend_run_time(self, source_key, store_backend):
-        from google.cloud import storage
-
-        gcs = storage.Client(project=store_backend.project)
+        gcs = self._get_gcs_client(store_backend.project)
         bucket = gcs.get_bucket(store_backend.bucket)
         run_name = source_key[-2]
 
         try:
-            self.validation_run_times[run_name] = parse(run_name).isoformat()
+            return _fast_parse_run_name(run_name)
         except ParserError:
             source_path = store_backend._convert_key_to_filepath(source_key)
             if not source_path.startswith(store_backend.prefix):
                 source_path = os.path.join(store_backend.prefix, source_path)
-            source_blob_created_time = bucket.get_blob(
-                source_path
-            ).time_created.isoformat()
-
-            self.validation_run_times[run_name] = source_blob_created_time
+            return bucket.get_blob(source_path).time_created.isoformat()
 
     def _get_skipped_store_and_site_names(self):
-        validations_stores_with_database_backends = [
-            store_dict.get("store_name")
-            for store_dict in self.upgrade_log["skipped_validations_stores"][
-                "database_store_backends"
-            ]
-        ]
-        metrics_stores_with_database_backends = [
-            store_dict.get("store_name")
-            for store_dict in self.upgrade_log["skipped_metrics_stores"][
-                "database_store_backends"
-            ]
-        ]
-
-        unsupported_validations_stores = [
-            store_dict.get("store_name")
-            for store_dict in self.upgrade_log["skipped_validations_stores"][
-                "unsupported"
-            ]
-        ]
-        unsupported_metrics_stores = [
-            store_dict.get("store_name")
-            for store_dict in self.upgrade_log["skipped_metrics_stores"]["unsupported"]
-        ]
-
-        stores_with_database_backends = (
-            validations_stores_with_database_backends
-            + metrics_stores_with_database_backends
-        )
-        stores_with_unsupported_backends = (
-            unsupported_validations_stores + unsupported_metrics_stores
-        )
-        doc_sites_with_unsupported_backends = [
-            doc_site_dict.get("site_name")
-            for doc_site_dict in self.upgrade_log["skipped_docs_validations_stores"][
-                "unsupported"
-            ]
-        ]
+        # Validations stores are listed before metrics stores, as the upgrade log lists them
         return (
-            stores_with_database_backends,
-            stores_with_unsupported_backends,
-            doc_sites_with_unsupported_backends,
+            self._skipped_db_validations_store_names
+            + self._skipped_db_metrics_store_names,
+            self._skipped_unsupported_validations_store_names
+            + self._skipped_unsupported_metrics_store_names,
+            self._skipped_unsupported_site_names,
         )
 
     def get_upgrade_prompt(self):
@@ -416,37 +663,27 @@ class UpgradeHelperV11:
             skip_with_unsupported_backends,
             skip_doc_sites_with_unsupported_backends,
         ) = self._get_skipped_store_and_site_names()
-        validations_store_name_checklist = [
-            store_name
-            for store_name in self.upgrade_checklist[
-                "validations_store_backends"
-            ].keys()
-        ]
-        site_name_checklist = [
-            site_name
-            for site_name in self.upgrade_checklist[
-                "docs_validations_store_backends"
-            ].keys()
-        ]
-
-        upgrade_text = f"""\
-**WARNING!**: This automated upgrade helper is currently experimental. Before proceeding, please make sure you have
-appropriate backups of your project.
-
-The following Stores and/or Data Docs sites will be upgraded:
-    - Validation Stores: {", ".join(validations_store_name_checklist) if validations_store_name_checklist else "None"}
-    - Data Docs Sites: {", ".join(site_name_checklist) if site_name_checklist else "None"}
 
-The following Stores and/or Data Docs sites must be upgraded manually, due to having a database backend, or backend
-type that is unsupported or unrecognized. Please consult the 0.11.x migration guide for more information:
-https://docs.greatexpectations.io/how_to_guides/migrating_versions.html
-    - Stores with database backends: {", ".join(skip_with_database_backends) if skip_with_database_backends else "None"}
-    - Stores with unsupported/unrecognized backends: {", ".join(skip_with_unsupported_backends) if skip_with_unsupported_backends else "None"}
-    - Data Docs sites with unsupported/unrecognized backends: {", ".join(skip_doc_sites_with_unsupported_backends) if skip_doc_sites_with_unsupported_backends else "None"}
-
-Would you like to proceed?
-"""
-        return upgrade_text
+        # Iterating over the checklist dicts directly yields their store and site names
+        return _UPGRADE_PROMPT_TEMPLATE.format_map(
+            {
+                "validations_stores": ", ".join(
+                    self.upgrade_checklist["validations_store_backends"]
+                )
+                or "None",
+                "docs_sites": ", ".join(
+                    self.upgrade_checklist["docs_validations_store_backends"]
+                )
+                or "None",
+                "database_stores": ", ".join(skip_with_database_backends) or "None",
+                "unsupported_stores": ", ".join(skip_with_unsupported_backends)
+                or "None",
+                "unsupported_docs_sites": ", ".join(
+                    skip_doc_sites_with_unsupported_backends
+                )
+                or "None",
+            }
+        )
 
     def upgrade_project(self):
         try:
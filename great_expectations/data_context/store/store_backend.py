@@ -39,6 +39,16 @@ class StoreBackend(object, metaclass=ABCMeta):
         self._validate_key(dest_key)
         return self._move(source_key, dest_key, **kwargs)
 
+    def copy(self, source_key, dest_key, patch_fn=None, **kwargs):
+        """Copy the value stored at source_key to dest_key.
+
+        If patch_fn is provided, it is called with the source value and its result is stored
+        at dest_key instead.
+        """
+        self._validate_key(source_key)
+        self._validate_key(dest_key)
+        return self._copy(source_key, dest_key, patch_fn=patch_fn, **kwargs)
+
     def has_key(self, key):
         self._validate_key(key)
         return self._has_key(key)
@@ -81,6 +91,13 @@ class StoreBackend(object, metaclass=ABCMeta):
     def _move(self, source_key, dest_key, **kwargs):
         raise NotImplementedError
 
+    def _copy(self, source_key, dest_key, patch_fn=None, **kwargs):
+        # Backends that can copy a value without reading it through the client override this
+        value = self._get(source_key)
+        if patch_fn is not None:
+            value = patch_fn(value)
+        return self._set(dest_key, value, **kwargs)
+
     @abstractmethod
     def list_keys(self, prefix=()):
         raise NotImplementedError
@@ -1,9 +1,12 @@
 # PYTHON 2 - py2 - update to ABC direct use rather than __metaclass__ once we drop py2 support
+import datetime
+import functools
 import logging
 import os
 import random
 import re
 import shutil
+import threading
 from abc import ABCMeta
 
 from great_expectations.data_context.store.store_backend import StoreBackend
@@ -11,6 +14,36 @@ from great_expectations.exceptions import StoreBackendError
 
 logger = logging.getLogger(__name__)
 
+# boto3's default session, used by boto3.client and boto3.resource, is not thread-safe
+_boto3_default_session_lock = threading.Lock()
+
+
+# Every get, set, copy and remove converts its key, often the same key several times,
+# so conversions are cached by everything they depend on
+@functools.lru_cache(maxsize=8192)
+def _convert_key_to_filepath(
+    key,
+    filepath_template,
+    filepath_prefix,
+    filepath_suffix,
+    platform_specific_separator,
+):
+    # NOTE: This function uses a hard-coded forward slash as a separator,
+    # and then replaces that with a platform-specific separator if requested (the default)
+    if filepath_template:
+        converted_string = filepath_template.format(*list(key))
+    else:
+        converted_string = "/".join(key)
+
+    if filepath_prefix:
+        converted_string = filepath_prefix + "/" + converted_string
+    if filepath_suffix:
+        converted_string += filepath_suffix
+    if platform_specific_separator:
+        converted_string = os.path.normpath(converted_string)
+
+    return converted_string
+
 
 class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
     """
@@ -81,22 +114,14 @@ class TupleStoreBackend(StoreBackend, metaclass=ABCMeta):
             )
 
     def _convert_key_to_filepath(self, key):
-        # NOTE: This method uses a hard-coded forward slash as a separator,
-        # and then replaces that with a platform-specific separator if requested (the default)
         self._validate_key(key)
-        if self.filepath_template:
-            converted_string = self.filepath_template.format(*list(key))
-        else:
-            converted_string = "/".join(key)
-
-        if self.filepath_prefix:
-            converted_string = self.filepath_prefix + "/" + converted_string
-        if self.filepath_suffix:
-            converted_string += self.filepath_suffix
-        if self.platform_specific_separator:
-            converted_string = os.path.normpath(converted_string)
-
-        return converted_string
+        return _convert_key_to_filepath(
+            key,
+            self.filepath_template,
+            self.filepath_prefix,
+            self.filepath_suffix,
+            self.platform_specific_separator,
+        )
 
     def _convert_filepath_to_key(self, filepath):
         if self.platform_specific_separator:
@@ -270,14 +295,57 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
 
         return False
 
+    def _copy(self, source_key, dest_key, patch_fn=None, **kwargs):
+        if patch_fn is not None:
+            return super()._copy(source_key, dest_key, patch_fn=patch_fn, **kwargs)
+
+        source_path = os.path.join(
+            self.full_base_directory, self._convert_key_to_filepath(source_key)
+        )
+        dest_path = os.path.join(
+            self.full_base_directory, self._convert_key_to_filepath(dest_key)
+        )
+        os.makedirs(os.path.dirname(dest_path), exist_ok=True)
+        shutil.copyfile(source_path, dest_path)
+        return dest_path
+
     def list_keys(self, prefix=()):
-        key_list = []
-        for root, dirs, files in os.walk(
-            os.path.join(self.full_base_directory, *prefix)
-        ):
-            for file_ in files:
-                full_path, file_name = os.path.split(os.path.join(root, file_))
-                relative_path = os.path.relpath(full_path, self.full_base_directory,)
+        return list(self.iter_keys(prefix=prefix))
+
+    def iter_keys(self, prefix=()):
+        """Yield the keys in this store backend one at a time, in the same order as list_keys."""
+        for key, _ in self._iter_keys_with_last_modified(prefix=prefix):
+            yield key
+
+    def _iter_keys_with_last_modified(self, prefix=()):
+        # Walk the directory tree in the same order as os.walk, but keep the stat results of os.scandir
+        directories = [os.path.join(self.full_base_directory, *prefix)]
+        while directories:
+            directory = directories.pop()
+            subdirectories = []
+            files = []
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        if entry.is_dir():
+                            # Like os.walk, do not descend into symlinked directories
+                            if not entry.is_symlink():
+                                subdirectories.append(entry.path)
+                            continue
+                        try:
+                            last_modified = datetime.datetime.fromtimestamp(
+                                entry.stat().st_mtime, tz=datetime.timezone.utc
+                            )
+                        except OSError:
+                            last_modified = None
+                        files.append((entry.name, last_modified))
+            except OSError:
+                # Like os.walk, skip directories that cannot be listed
+                continue
+            directories.extend(reversed(subdirectories))
+
+            relative_path = os.path.relpath(directory, self.full_base_directory)
+            for file_name, last_modified in files:
                 if relative_path == ".":
                     filepath = file_name
                 else:
@@ -293,9 +361,7 @@ class TupleFilesystemStoreBackend(TupleStoreBackend):
                     continue
                 key = self._convert_filepath_to_key(filepath)
                 if key and not self.is_ignored_key(key):
-                    key_list.append(key)
-
-        return key_list
+                    yield key, last_modified
 
     def rrmdir(self, mroot, curpath):
         """
@@ -371,13 +437,34 @@ class TupleS3StoreBackend(TupleStoreBackend):
         )
         self.bucket = bucket
         self.prefix = prefix
+        self._s3_client = None
+        self._s3_resources = threading.local()
+
+    def _get_s3_client(self):
+        """Return the S3 client of this store backend, which boto3 allows to be shared between threads."""
+        if self._s3_client is None:
+            import boto3
+
+            # The client is created from boto3's default session, so that boto3.setup_default_session applies
+            with _boto3_default_session_lock:
+                if self._s3_client is None:
+                    self._s3_client = boto3.client("s3")
+        return self._s3_client
+
+    def _get_s3_resource(self):
+        """Return an S3 resource for the current thread, as boto3 resources may not be shared between threads."""
+        s3_resource = getattr(self._s3_resources, "resource", None)
+        if s3_resource is None:
+            import boto3
+
+            with _boto3_default_session_lock:
+                s3_resource = self._s3_resources.resource = boto3.resource("s3")
+        return s3_resource
 
     def _get(self, key):
         s3_object_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
 
-        import boto3
-
-        s3 = boto3.client("s3")
+        s3 = self._get_s3_client()
         s3_response_object = s3.get_object(Bucket=self.bucket, Key=s3_object_key)
         return (
             s3_response_object["Body"]
@@ -390,9 +477,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
     ):
         s3_object_key = os.path.join(self.prefix, self._convert_key_to_filepath(key))
 
-        import boto3
-
-        s3 = boto3.resource("s3")
+        s3 = self._get_s3_resource()
         result_s3 = s3.Object(self.bucket, s3_object_key)
         if isinstance(value, str):
             result_s3.put(
@@ -405,9 +490,7 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return s3_object_key
 
     def _move(self, source_key, dest_key, **kwargs):
-        import boto3
-
-        s3 = boto3.resource("s3")
+        s3 = self._get_s3_resource()
 
         source_filepath = self._convert_key_to_filepath(source_key)
         if not source_filepath.startswith(self.prefix):
@@ -422,46 +505,68 @@ class TupleS3StoreBackend(TupleStoreBackend):
 
         s3.Object(self.bucket, source_filepath).delete()
 
-    def list_keys(self):
-        key_list = []
-
-        import boto3
+    def _copy(self, source_key, dest_key, patch_fn=None, **kwargs):
+        s3 = self._get_s3_client()
 
-        s3 = boto3.client("s3")
+        source_filepath = os.path.join(
+            self.prefix, self._convert_key_to_filepath(source_key)
+        )
+        dest_filepath = os.path.join(
+            self.prefix, self._convert_key_to_filepath(dest_key)
+        )
 
-        s3_objects = s3.list_objects(Bucket=self.bucket, Prefix=self.prefix)
-        if "Contents" in s3_objects:
-            objects = s3_objects["Contents"]
-        elif "CommonPrefixes" in s3_objects:
-            logger.warning(
-                "TupleS3StoreBackend returned CommonPrefixes, but delimiter should not have been set."
-            )
-            objects = []
-        else:
-            # No objects found in store
-            objects = []
+        if patch_fn is not None:
+            s3_response_object = s3.get_object(Bucket=self.bucket, Key=source_filepath)
+            content_encoding = s3_response_object.get("ContentEncoding", "utf-8")
+            value = s3_response_object["Body"].read().decode(content_encoding)
+            patched_value = patch_fn(value)
+            if patched_value != value:
+                # Keep the content encoding and type of the source object, as the server-side copy does
+                kwargs.setdefault("content_encoding", content_encoding)
+                kwargs.setdefault(
+                    "content_type",
+                    s3_response_object.get("ContentType", "application/json"),
+                )
+                return self._set(dest_key, patched_value, **kwargs)
 
-        for s3_object_info in objects:
-            s3_object_key = s3_object_info["Key"]
-            s3_object_key = os.path.relpath(s3_object_key, self.prefix,)
-            if self.filepath_prefix and not s3_object_key.startswith(
-                self.filepath_prefix
-            ):
-                continue
-            elif self.filepath_suffix and not s3_object_key.endswith(
-                self.filepath_suffix
-            ):
-                continue
-            key = self._convert_filepath_to_key(s3_object_key)
-            if key:
-                key_list.append(key)
+        # Server-side copy: the object body is not transferred through the client
+        s3.copy_object(
+            CopySource={"Bucket": self.bucket, "Key": source_filepath},
+            Bucket=self.bucket,
+            Key=dest_filepath,
+        )
+        return dest_filepath
 
-        return key_list
+    def list_keys(self):
+        return list(self.iter_keys())
+
+    def iter_keys(self):
+        """Yield the keys in this store backend one page of the bucket listing at a time."""
+        for key, _ in self._iter_keys_with_last_modified():
+            yield key
+
+    def _iter_keys_with_last_modified(self):
+        s3 = self._get_s3_client()
+        paginator = s3.get_paginator("list_objects_v2")
+
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self.prefix):
+            for s3_object_info in page.get("Contents", []):
+                s3_object_key = s3_object_info["Key"]
+                s3_object_key = os.path.relpath(s3_object_key, self.prefix,)
+                if self.filepath_prefix and not s3_object_key.startswith(
+                    self.filepath_prefix
+                ):
+                    continue
+                elif self.filepath_suffix and not s3_object_key.endswith(
+                    self.filepath_suffix
+                ):
+                    continue
+                key = self._convert_filepath_to_key(s3_object_key)
+                if key:
+                    yield key, s3_object_info["LastModified"]
 
     def get_url_for_key(self, key, protocol=None):
-        import boto3
-
-        location = boto3.client("s3").get_bucket_location(Bucket=self.bucket)[
+        location = self._get_s3_client().get_bucket_location(Bucket=self.bucket)[
             "LocationConstraint"
         ]
         if location is None:
@@ -474,10 +579,9 @@ class TupleS3StoreBackend(TupleStoreBackend):
         return f"https://{location}.amazonaws.com/{self.bucket}/{self.prefix}/{s3_key}"
 
     def remove_key(self, key):
-        import boto3
         from botocore.exceptions import ClientError
 
-        s3 = boto3.resource("s3")
+        s3 = self._get_s3_resource()
         s3_key = self._convert_key_to_filepath(key)
         if s3_key:
             try:
@@ -588,9 +692,44 @@ class TupleGCSStoreBackend(TupleStoreBackend):
         blob = bucket.blob(source_filepath)
         new_blob = bucket.rename_blob(blob, dest_filepath)
 
+    def _copy(self, source_key, dest_key, patch_fn=None, **kwargs):
+        from google.cloud import storage
+
+        gcs = storage.Client(project=self.project)
+        bucket = gcs.get_bucket(self.bucket)
+
+        source_filepath = os.path.join(
+            self.prefix, self._convert_key_to_filepath(source_key)
+        )
+        dest_filepath = os.path.join(
+            self.prefix, self._convert_key_to_filepath(dest_key)
+        )
+
+        if patch_fn is not None:
+            source_blob = bucket.get_blob(source_filepath)
+            value = source_blob.download_as_string().decode("utf-8")
+            patched_value = patch_fn(value)
+            if patched_value != value:
+                # Keep the content encoding and type of the source blob, as the server-side copy does
+                if source_blob.content_encoding:
+                    kwargs.setdefault("content_encoding", source_blob.content_encoding)
+                if source_blob.content_type:
+                    kwargs.setdefault("content_type", source_blob.content_type)
+                return self._set(dest_key, patched_value, **kwargs)
+
+        # Server-side copy: the blob body is not transferred through the client
+        bucket.copy_blob(bucket.blob(source_filepath), bucket, dest_filepath)
+        return dest_filepath
+
     def list_keys(self):
-        key_list = []
+        return list(self.iter_keys())
+
+    def iter_keys(self):
+        """Yield the keys in this store backend one page of the bucket listing at a time."""
+        for key, _ in self._iter_keys_with_last_modified():
+            yield key
 
+    def _iter_keys_with_last_modified(self):
         from google.cloud import storage
 
         gcs = storage.Client(self.project)
@@ -608,8 +747,7 @@ class TupleGCSStoreBackend(TupleStoreBackend):
                 continue
             key = self._convert_filepath_to_key(gcs_object_key)
             if key:
-                key_list.append(key)
-        return key_list
+                yield key, blob.time_created
 
     def get_url_for_key(self, key, protocol=None):
         path = self._convert_key_to_filepath(key)
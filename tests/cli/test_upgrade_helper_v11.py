@@ -0,0 +1,417 @@
+import datetime
+import json
+import os
+
+import pytest
+from dateutil.parser import ParserError, parse
+
+from great_expectations.cli.upgrade_helpers import UpgradeHelperV11, upgrade_helper_v11
+from great_expectations.data_context.store import InMemoryStoreBackend
+
+
+def test_upgrade_helper_v11_upgrades_filesystem_validations_store(empty_data_context,):
+    context = empty_data_context
+    store_backend = context.stores["validations_store"].store_backend
+
+    source_keys = [
+        ("my_suite", "20200101T000000.000000Z", "batch_1"),
+        ("my_suite", "20200101T000000.000000Z", "batch_2"),
+        ("my_other.suite", "2020-01-02T10:00:00", "batch_1"),
+        ("my_suite", "my_run", "batch_1"),
+    ]
+    for source_key in source_keys:
+        store_backend.set(
+            source_key,
+            json.dumps({"meta": {"run_id": source_key[-2]}, "results": [1, 2, 3]}),
+        )
+
+    # A run name that is not a datetime gets the modification time of its validation result
+    my_run_time = datetime.datetime.fromtimestamp(
+        os.path.getmtime(
+            os.path.join(
+                store_backend.full_base_directory,
+                store_backend._convert_key_to_filepath(
+                    ("my_suite", "my_run", "batch_1")
+                ),
+            )
+        ),
+        tz=datetime.timezone.utc,
+    ).isoformat()
+
+    upgrade_helper = UpgradeHelperV11(data_context=context)
+    upgrade_log = upgrade_helper.upgrade_project()
+
+    assert upgrade_log["exceptions"] == []
+    upgraded_store_log = upgrade_log["upgraded_validations_stores"]["validations_store"]
+    assert not upgraded_store_log["exceptions"]
+    # Upgraded keys listed again while walking the store are not upgraded a second time
+    assert len(upgraded_store_log["validations_updated"]) == 4
+
+    assert set(store_backend.list_keys()) == {
+        ("my_suite", "20200101T000000.000000Z", "2020-01-01T00:00:00+00:00", "batch_1"),
+        ("my_suite", "20200101T000000.000000Z", "2020-01-01T00:00:00+00:00", "batch_2"),
+        ("my_other.suite", "2020-01-02T10:00:00", "2020-01-02T10:00:00", "batch_1"),
+        ("my_suite", "my_run", my_run_time, "batch_1"),
+    }
+    for key in store_backend.list_keys():
+        validation_json_dict = json.loads(store_backend.get(key))
+        assert validation_json_dict["meta"]["run_id"] == {
+            "run_name": key[-3],
+            "run_time": key[-2],
+        }
+        assert validation_json_dict["results"] == [1, 2, 3]
+
+
+def test_upgrade_helper_v11_bad_run_name_only_fails_its_own_key(empty_data_context):
+    context = empty_data_context
+    store_backend = context.stores["validations_store"].store_backend
+
+    # dateutil raises OverflowError, rather than ParserError, for this run name
+    bad_source_key = ("my_suite", "99999999999999999999", "batch_1")
+    source_keys = [
+        ("my_suite", "20200101T000000.000000Z", "batch_1"),
+        bad_source_key,
+        ("my_suite", "2020-01-02T10:00:00", "batch_1"),
+    ]
+    for source_key in source_keys:
+        store_backend.set(
+            source_key, json.dumps({"meta": {"run_id": source_key[-2]}, "results": []}),
+        )
+
+    upgrade_helper = UpgradeHelperV11(data_context=context)
+    upgrade_log = upgrade_helper.upgrade_project()
+
+    assert len(upgrade_log["exceptions"]) == 1
+    exception_log = upgrade_log["exceptions"][0]
+    assert exception_log["src"] == store_backend.get_url_for_key(bad_source_key)
+    assert exception_log["exception_message"].startswith("OverflowError")
+    upgraded_store_log = upgrade_log["upgraded_validations_stores"]["validations_store"]
+    assert upgraded_store_log["exceptions"]
+    assert len(upgraded_store_log["validations_updated"]) == 2
+
+    assert set(store_backend.list_keys()) == {
+        ("my_suite", "20200101T000000.000000Z", "2020-01-01T00:00:00+00:00", "batch_1"),
+        bad_source_key,
+        ("my_suite", "2020-01-02T10:00:00", "2020-01-02T10:00:00", "batch_1"),
+    }
+
+
+def test_upgrade_helper_v11_looks_up_each_run_time_once(empty_data_context):
+    store_backend = InMemoryStoreBackend()
+    source_keys = [
+        ("my_suite", run_name, batch)
+        for run_name in ["my_run", "my_bad_run"]
+        for batch in ["batch_1", "batch_2", "batch_3"]
+    ]
+    for source_key in source_keys:
+        store_backend.set(
+            source_key, json.dumps({"meta": {"run_id": source_key[-2]}, "results": []}),
+        )
+
+    looked_up_run_names = []
+
+    def get_run_time(source_key, store_backend):
+        looked_up_run_names.append(source_key[-2])
+        if source_key[-2] == "my_bad_run":
+            raise OverflowError("Unable to look up run time")
+        return "2020-01-01T00:00:00+00:00"
+
+    upgrade_helper = UpgradeHelperV11(data_context=empty_data_context)
+    upgrade_helper.run_time_setters_by_backend_type[InMemoryStoreBackend] = get_run_time
+    upgrade_helper.upgrade_log["upgraded_validations_stores"]["my_store"] = {
+        "validations_updated": [],
+        "exceptions": False,
+    }
+    upgrade_helper.upgrade_store_backend(store_backend, store_name="my_store")
+
+    assert sorted(looked_up_run_names) == ["my_bad_run", "my_run"]
+    upgrade_log = upgrade_helper.upgrade_log
+    assert len(upgrade_log["exceptions"]) == 3
+    assert all(
+        exception_log["exception_message"].startswith("OverflowError")
+        for exception_log in upgrade_log["exceptions"]
+    )
+    assert (
+        len(
+            upgrade_log["upgraded_validations_stores"]["my_store"][
+                "validations_updated"
+            ]
+        )
+        == 3
+    )
+    assert set(store_backend.list_keys()) == {
+        ("my_suite", "my_run", "2020-01-01T00:00:00+00:00", "batch_1"),
+        ("my_suite", "my_run", "2020-01-01T00:00:00+00:00", "batch_2"),
+        ("my_suite", "my_run", "2020-01-01T00:00:00+00:00", "batch_3"),
+        ("my_suite", "my_bad_run", "batch_1"),
+        ("my_suite", "my_bad_run", "batch_2"),
+        ("my_suite", "my_bad_run", "batch_3"),
+    }
+
+
+def _update_validation_result_json(upgrade_helper, value):
+    store_backend = InMemoryStoreBackend()
+    source_key = ("my_suite", "my_run", "batch_1")
+    dest_key = ("my_suite", "my_run", "2020-01-01T00:00:00+00:00", "batch_1")
+    store_backend.set(source_key, value)
+    upgrade_helper.validation_run_times["my_run"] = "2020-01-01T00:00:00+00:00"
+
+    upgrade_helper._update_validation_result_json(
+        source_key=source_key,
+        dest_key=dest_key,
+        run_name="my_run",
+        store_backend=store_backend,
+    )
+
+    assert store_backend.list_keys() == [dest_key]
+    return store_backend.get(dest_key)
+
+
+def test_upgrade_helper_v11_update_validation_result_json_with_orjson(
+    empty_data_context,
+):
+    pytest.importorskip("orjson")
+    upgrade_helper = UpgradeHelperV11(data_context=empty_data_context)
+
+    patched_value = _update_validation_result_json(
+        upgrade_helper, json.dumps({"meta": {"run_id": "my_run"}, "results": ["café"]}),
+    )
+
+    # orjson serializes without whitespace and does not escape non-ASCII characters
+    assert patched_value == (
+        '{"meta":{"run_id":{"run_name":"my_run",'
+        '"run_time":"2020-01-01T00:00:00+00:00"}},"results":["café"]}'
+    )
+
+
+def test_upgrade_helper_v11_update_validation_result_json_with_nan_falls_back_to_json(
+    empty_data_context,
+):
+    pytest.importorskip("orjson")
+    upgrade_helper = UpgradeHelperV11(data_context=empty_data_context)
+
+    patched_value = _update_validation_result_json(
+        upgrade_helper,
+        json.dumps({"meta": {"run_id": "my_run"}, "results": [float("nan")]}),
+    )
+
+    assert patched_value == json.dumps(
+        {
+            "meta": {
+                "run_id": {
+                    "run_name": "my_run",
+                    "run_time": "2020-01-01T00:00:00+00:00",
+                }
+            },
+            "results": [float("nan")],
+        }
+    )
+
+
+def test_upgrade_helper_v11_update_validation_result_json_without_orjson(
+    empty_data_context, monkeypatch
+):
+    monkeypatch.setattr(upgrade_helper_v11, "orjson", None)
+    upgrade_helper = UpgradeHelperV11(data_context=empty_data_context)
+
+    patched_value = _update_validation_result_json(
+        upgrade_helper, json.dumps({"meta": {"run_id": "my_run"}, "results": ["café"]}),
+    )
+
+    assert patched_value == (
+        '{"meta": {"run_id": {"run_name": "my_run", '
+        '"run_time": "2020-01-01T00:00:00+00:00"}}, "results": ["caf\\u00e9"]}'
+    )
+
+
+NEW_RUN_ID_DICT = {"run_name": "my_run", "run_time": "2020-01-01T00:00:00+00:00"}
+
+
+def test_upgrade_helper_v11_patch_run_id_in_place_single_match():
+    value = json.dumps(
+        {
+            "results": [{"meta": {}, "result": {"details": {}}}],
+            "meta": {"batch_kwargs": {"a": "}]"}, "run_id": "my_run"},
+            "success": True,
+        }
+    )
+
+    patched_value = UpgradeHelperV11._patch_run_id_in_place(
+        value, "my_run", NEW_RUN_ID_DICT
+    )
+
+    assert json.loads(patched_value) == {
+        "results": [{"meta": {}, "result": {"details": {}}}],
+        "meta": {"batch_kwargs": {"a": "}]"}, "run_id": NEW_RUN_ID_DICT},
+        "success": True,
+    }
+
+
+def test_upgrade_helper_v11_patch_run_id_in_place_with_meta_before_results():
+    value = json.dumps(
+        {"meta": {"run_id": "my_run"}, "results": [{"meta": {}, "result": {}}]}
+    )
+
+    patched_value = UpgradeHelperV11._patch_run_id_in_place(
+        value, "my_run", NEW_RUN_ID_DICT
+    )
+
+    assert json.loads(patched_value) == {
+        "meta": {"run_id": NEW_RUN_ID_DICT},
+        "results": [{"meta": {}, "result": {}}],
+    }
+
+
+def test_upgrade_helper_v11_patch_run_id_in_place_multiple_matches():
+    value = json.dumps(
+        {"results": [{"meta": {"run_id": "my_run"}}], "meta": {"run_id": "my_run"},}
+    )
+
+    assert (
+        UpgradeHelperV11._patch_run_id_in_place(value, "my_run", NEW_RUN_ID_DICT)
+        is None
+    )
+
+
+def test_upgrade_helper_v11_patch_run_id_in_place_nested_decoy():
+    value = json.dumps(
+        {
+            "results": [{"meta": {}, "result": {"details": {"run_id": "my_run"}}}],
+            "meta": {"run_id": NEW_RUN_ID_DICT},
+        }
+    )
+    assert (
+        UpgradeHelperV11._patch_run_id_in_place(value, "my_run", NEW_RUN_ID_DICT)
+        is None
+    )
+
+    value = json.dumps(
+        {
+            "results": [{"meta": {"run_id": "my_run"}, "result": {}}],
+            "meta": {"expectation_suite_name": "my_suite"},
+        }
+    )
+    assert (
+        UpgradeHelperV11._patch_run_id_in_place(value, "my_run", NEW_RUN_ID_DICT)
+        is None
+    )
+
+    value = json.dumps(
+        {"meta": {"batch_kwargs": {}}, "details": {"run_id": "my_run"}, "results": []}
+    )
+    assert (
+        UpgradeHelperV11._patch_run_id_in_place(value, "my_run", NEW_RUN_ID_DICT)
+        is None
+    )
+
+
+def test_upgrade_helper_v11_patch_run_id_in_place_escaped_quotes():
+    run_name = 'my "quoted" run'
+    value = json.dumps(
+        {
+            "results": [{"result": {"details": '"run_id": "my_run" {'}}],
+            "meta": {"run_id": run_name},
+        }
+    )
+    new_run_id_dict = {"run_name": run_name, "run_time": "2020-01-01T00:00:00+00:00"}
+
+    patched_value = UpgradeHelperV11._patch_run_id_in_place(
+        value, run_name, new_run_id_dict
+    )
+
+    assert json.loads(patched_value) == {
+        "results": [{"result": {"details": '"run_id": "my_run" {'}}],
+        "meta": {"run_id": new_run_id_dict},
+    }
+
+
+def test_upgrade_helper_v11_patch_run_id_in_place_already_upgraded():
+    value = json.dumps({"results": [], "meta": {"run_id": NEW_RUN_ID_DICT}})
+
+    assert (
+        UpgradeHelperV11._patch_run_id_in_place(value, "my_run", NEW_RUN_ID_DICT)
+        is None
+    )
+
+
+def test_upgrade_helper_v11_format_exception(empty_data_context):
+    upgrade_helper = UpgradeHelperV11(data_context=empty_data_context)
+
+    def fail_here():
+        raise ValueError("failed")
+
+    def fail_there():
+        raise ValueError("failed")
+
+    def format_exception(fail):
+        try:
+            fail()
+        except ValueError as e:
+            return upgrade_helper._format_exception(e)
+
+    exception_message = format_exception(fail_here)
+    assert exception_message.startswith('ValueError: "failed".  Traceback: "')
+    assert "fail_here" in exception_message
+
+    # The same exception raised from the same place shares its message
+    assert format_exception(fail_here) is exception_message
+
+    # The same exception raised from elsewhere gets its own traceback
+    exception_message = format_exception(fail_there)
+    assert "fail_there" in exception_message
+    assert "fail_here" not in exception_message
+
+    # The traceback is that of the exception formatted, not of the exception being handled
+    try:
+        fail_here()
+    except ValueError as e:
+        exception_raised_here = e
+    try:
+        fail_there()
+    except ValueError:
+        exception_message = upgrade_helper._format_exception(exception_raised_here)
+    assert "fail_here" in exception_message
+    assert "fail_there" not in exception_message
+
+
+@pytest.mark.parametrize(
+    "run_name",
+    [
+        "20200101T000000.000000Z",
+        "20200613T101112.123456Z",
+        "20200613T101112.5Z",
+        "2020-06-13T10:11:12",
+        "2020-06-13T10:11:12.123456+02:00",
+        "2020-06-13 10:11:12",
+        "June 13 2020",
+    ],
+)
+def test_upgrade_helper_v11_fast_parse_run_name_matches_dateutil(run_name):
+    assert (
+        upgrade_helper_v11._fast_parse_run_name(run_name) == parse(run_name).isoformat()
+    )
+
+
+def test_upgrade_helper_v11_fast_parse_run_name_not_a_datetime():
+    with pytest.raises(ParserError):
+        upgrade_helper_v11._fast_parse_run_name("my_run")
+    with pytest.raises(ParserError):
+        upgrade_helper_v11._fast_parse_run_name("20201301T000000.000000Z")
+
+
+def test_upgrade_helper_v11_fast_parse_run_name_caches_run_names_that_are_not_datetimes(
+    monkeypatch,
+):
+    parsed_run_names = []
+
+    def parse_run_name(run_name):
+        parsed_run_names.append(run_name)
+        return parse(run_name)
+
+    monkeypatch.setattr(upgrade_helper_v11, "parse", parse_run_name)
+
+    for _ in range(3):
+        with pytest.raises(ParserError):
+            upgrade_helper_v11._fast_parse_run_name("my_run_that_is_parsed_once")
+
+    assert parsed_run_names == ["my_run_that_is_parsed_once"]
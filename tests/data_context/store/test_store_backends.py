@@ -1,4 +1,7 @@
+import datetime
 import os
+import threading
+from unittest.mock import patch
 
 import boto3
 import pytest
@@ -142,6 +145,73 @@ test_TupleFilesystemStoreBackend__dir0/
         assert my_store.get(("BBB",)) == ""
 
 
+def test_TupleFilesystemStoreBackend_copy(tmp_path_factory):
+    project_path = str(tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_copy"))
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=os.path.abspath("dummy_str"),
+        base_directory=project_path,
+        filepath_suffix=".json",
+    )
+
+    my_store.set(("AAA", "aaa"), "aaa")
+
+    my_store.copy(("AAA", "aaa"), ("BBB", "bbb"))
+    assert my_store.get(("BBB", "bbb")) == "aaa"
+
+    my_store.copy(("AAA", "aaa"), ("CCC",), patch_fn=lambda value: value.upper())
+    assert my_store.get(("CCC",)) == "AAA"
+
+    assert my_store.get(("AAA", "aaa")) == "aaa"
+    assert set(my_store.list_keys()) == {("AAA", "aaa"), ("BBB", "bbb"), ("CCC",)}
+
+
+def test_TupleFilesystemStoreBackend_iter_keys(tmp_path_factory):
+    project_path = str(
+        tmp_path_factory.mktemp("test_TupleFilesystemStoreBackend_iter_keys")
+    )
+
+    my_store = TupleFilesystemStoreBackend(
+        root_directory=os.path.abspath("dummy_str"),
+        base_directory=project_path,
+        filepath_suffix=".json",
+    )
+
+    my_store.set(("AAA", "aaa"), "aaa")
+    my_store.set(("AAA", "bbb"), "bbb")
+    my_store.set(("BBB",), "bbb")
+    with open(os.path.join(project_path, "not_a_key.txt"), "w") as f:
+        f.write("")
+
+    keys = my_store.iter_keys()
+    assert next(keys) in {("AAA", "aaa"), ("AAA", "bbb"), ("BBB",)}
+    assert list(my_store.iter_keys()) == my_store.list_keys()
+
+    # Keys are listed in the same order as os.walk walks the directory tree
+    my_store.set(("AAA", "ccc", "ddd"), "ddd")
+    assert list(my_store.iter_keys()) == [
+        my_store._convert_filepath_to_key(
+            os.path.relpath(os.path.join(root, file_), project_path)
+        )
+        for root, dirs, files in os.walk(project_path)
+        for file_ in files
+        if file_.endswith(".json")
+    ]
+    my_store.remove_key(("AAA", "ccc", "ddd"))
+    assert set(my_store.iter_keys()) == {("AAA", "aaa"), ("AAA", "bbb"), ("BBB",)}
+    assert set(my_store.iter_keys(prefix=("AAA",))) == {("AAA", "aaa"), ("AAA", "bbb")}
+    assert list(my_store.iter_keys(prefix=("CCC",))) == []
+
+    # The listing also provides each file's modification time
+    for key, last_modified in my_store._iter_keys_with_last_modified():
+        assert last_modified == datetime.datetime.fromtimestamp(
+            os.path.getmtime(
+                os.path.join(project_path, my_store._convert_key_to_filepath(key))
+            ),
+            tz=datetime.timezone.utc,
+        )
+
+
 def test_TupleFilesystemStoreBackend_ignores_jupyter_notebook_checkpoints(
     tmp_path_factory,
 ):
@@ -235,6 +305,104 @@ def test_TupleS3StoreBackend_with_prefix():
     assert exc.value.response["Error"]["Code"] == "NoSuchKey"
 
 
+@mock_s3
+def test_TupleS3StoreBackend_copy():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, prefix=prefix,
+    )
+
+    my_store.set(("AAA",), "aaa", content_type="text/html; charset=utf-8")
+
+    with patch.object(my_store, "_set", wraps=my_store._set) as mock_set:
+        my_store.copy(("AAA",), ("BBB",))
+        # An unchanged patched value is still copied server-side
+        my_store.copy(("AAA",), ("CCC",), patch_fn=lambda value: value)
+        mock_set.assert_not_called()
+
+        my_store.copy(("AAA",), ("DDD",), patch_fn=lambda value: value.upper())
+        mock_set.assert_called_once()
+
+    assert my_store.get(("BBB",)) == "aaa"
+    assert my_store.get(("CCC",)) == "aaa"
+    assert my_store.get(("DDD",)) == "AAA"
+
+    # Copied objects keep the content type of the source object, whether or not they were patched
+    for key in ["BBB", "CCC", "DDD"]:
+        obj = boto3.client("s3").get_object(
+            Bucket=bucket, Key=prefix + "/my_file_" + key
+        )
+        assert obj["ContentType"] == "text/html; charset=utf-8"
+        assert obj["ContentEncoding"] == "utf-8"
+
+    assert my_store.get(("AAA",)) == "aaa"
+    assert set(my_store.list_keys()) == {("AAA",), ("BBB",), ("CCC",), ("DDD",)}
+
+
+@mock_s3
+def test_TupleS3StoreBackend_iter_keys():
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+
+    conn = boto3.resource("s3", region_name="us-east-1")
+    conn.create_bucket(Bucket=bucket)
+    conn.Object(bucket, "not_in_prefix/my_file_CCC").put(Body="ccc")
+
+    my_store = TupleS3StoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, prefix=prefix,
+    )
+
+    assert list(my_store.iter_keys()) == []
+
+    my_store.set(("AAA",), "aaa")
+    my_store.set(("BBB",), "bbb")
+
+    assert list(my_store.iter_keys()) == my_store.list_keys()
+    assert set(my_store.iter_keys()) == {("AAA",), ("BBB",)}
+    for key, last_modified in my_store._iter_keys_with_last_modified():
+        assert (
+            last_modified
+            == conn.Object(
+                bucket, prefix + "/" + my_store._convert_key_to_filepath(key)
+            ).last_modified
+        )
+
+
+@mock_s3
+def test_TupleS3StoreBackend_reuses_client_from_default_session():
+    my_store = TupleS3StoreBackend(bucket="leakybucket")
+
+    boto3.setup_default_session(region_name="eu-west-1")
+    try:
+        s3 = my_store._get_s3_client()
+    finally:
+        boto3.DEFAULT_SESSION = None
+
+    assert s3.meta.region_name == "eu-west-1"
+    assert my_store._get_s3_client() is s3
+
+
+@mock_s3
+def test_TupleS3StoreBackend_uses_one_resource_per_thread():
+    my_store = TupleS3StoreBackend(bucket="leakybucket")
+
+    s3 = my_store._get_s3_resource()
+    assert my_store._get_s3_resource() is s3
+
+    other_thread_resources = []
+    other_thread = threading.Thread(
+        target=lambda: other_thread_resources.append(my_store._get_s3_resource())
+    )
+    other_thread.start()
+    other_thread.join()
+    assert other_thread_resources[0] is not s3
+
+
 @mock_s3
 def test_TupleS3StoreBackend_with_empty_prefixes():
     """
@@ -377,3 +545,66 @@ def test_TupleGCSStoreBackend():
             mock_client.get_bucket.assert_called_once_with("leakybucket")
         except NotFound:
             pass
+
+
+def test_TupleGCSStoreBackend_copy():
+    pytest.importorskip("google.cloud.storage")
+    bucket = "leakybucket"
+    prefix = "this_is_a_test_prefix"
+    project = "dummy-project"
+
+    my_store = TupleGCSStoreBackend(
+        filepath_template="my_file_{0}", bucket=bucket, prefix=prefix, project=project
+    )
+
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_bucket = mock_gcs_client.return_value.get_bucket.return_value
+        mock_source_blob = mock_bucket.get_blob.return_value
+        mock_source_blob.download_as_string.return_value = b"aaa"
+        mock_source_blob.content_encoding = "utf-8"
+        mock_source_blob.content_type = "text/html"
+
+        my_store.copy(("AAA",), ("BBB",))
+
+        mock_bucket.blob.assert_called_once_with("this_is_a_test_prefix/my_file_AAA")
+        mock_bucket.copy_blob.assert_called_once_with(
+            mock_bucket.blob.return_value,
+            mock_bucket,
+            "this_is_a_test_prefix/my_file_BBB",
+        )
+        mock_bucket.get_blob.assert_not_called()
+
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_bucket = mock_gcs_client.return_value.get_bucket.return_value
+        mock_source_blob = mock_bucket.get_blob.return_value
+        mock_source_blob.download_as_string.return_value = b"aaa"
+
+        # An unchanged patched value is still copied server-side
+        my_store.copy(("AAA",), ("CCC",), patch_fn=lambda value: value)
+
+        mock_bucket.get_blob.assert_called_once_with(
+            "this_is_a_test_prefix/my_file_AAA"
+        )
+        mock_bucket.copy_blob.assert_called_once_with(
+            mock_bucket.blob.return_value,
+            mock_bucket,
+            "this_is_a_test_prefix/my_file_CCC",
+        )
+        mock_bucket.blob.return_value.upload_from_string.assert_not_called()
+
+    with patch("google.cloud.storage.Client", autospec=True) as mock_gcs_client:
+        mock_bucket = mock_gcs_client.return_value.get_bucket.return_value
+        mock_source_blob = mock_bucket.get_blob.return_value
+        mock_source_blob.download_as_string.return_value = b"aaa"
+        mock_source_blob.content_encoding = "utf-8"
+        mock_source_blob.content_type = "text/html"
+
+        my_store.copy(("AAA",), ("DDD",), patch_fn=lambda value: value.upper())
+
+        mock_bucket.copy_blob.assert_not_called()
+        mock_bucket.blob.assert_called_once_with("this_is_a_test_prefix/my_file_DDD")
+        mock_dest_blob = mock_bucket.blob.return_value
+        assert mock_dest_blob.content_encoding == "utf-8"
+        mock_dest_blob.upload_from_string.assert_called_once_with(
+            b"AAA", content_type="text/html"
+        )